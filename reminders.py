@@ -1,24 +1,53 @@
 #!/usr/bin/env python3
 import argparse
+import atexit
+import bisect
+import csv
 import datetime
+import hashlib
+import io
+import json
+import pickle
 import prettytable
+import queue
 import re
 import sys
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from getpass import getpass
-from pandas import ExcelFile
 from pathlib import Path
-from smtplib import SMTP
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
 from typing import List
-from typing import Optional
+from typing import NamedTuple
 from typing import Set
 from typing import Tuple
+from typing import Union
+
+if TYPE_CHECKING:
+    # pandas (and the email modules) are only imported when needed, which keeps the
+    # start-up quick for --help and configuration errors
+    from pandas import DataFrame
+    from pandas import ExcelFile
+    from pandas import Series
+    from smtplib import SMTP
+
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    # python-calamine is required, but openpyxl still works (just much slower)
+    EXCEL_ENGINE = 'openpyxl'
 
 
 ###############################################################################
@@ -29,9 +58,15 @@ CSECT_SOURCE = 'source'
 
 ROW_HEADER = '_row'
 
-FIELD_RE = re.compile(r'\{.*\}')
+FIELD_RE = re.compile(r'\{([^{}]+)\}')
+TOKEN_RE = re.compile(r'[/,\s]+')
 NL = '\n\t'
 
+MAX_SEND_THREADS = 8
+
+CACHE_DIR = Path.home() / '.cache' / 'reminders'
+CACHE_VERSION = 2  # bumped whenever the parsed frames change shape/values
+
 
 #####################
 # constants for program
@@ -68,6 +103,164 @@ class AmbiguousUser(Exception):
         super().__init__(message)
 
 
+class UserIndex(NamedTuple):
+    """
+    Pre-computed lookups for finding users
+    """
+    tokens: Dict[str, List[Dict]]  # casefolded value/token to the users with it
+    users: List[Dict]
+    starts: List[int]  # offset of each user's values in the text
+    text: str  # casefolded values of all the users
+
+
+class TemplateValues(dict):
+    """
+    Dictionary of the template values that raises a ValueError for missing fields
+    """
+    def __missing__(self, key: str) -> str:
+        raise ValueError(f"Missing user field='{key}'")
+
+
+class Correlation(list):
+    """
+    List of tuple(user, list(actions)) from correlate(), that can also look up a user's actions
+    """
+    def __init__(self, pairs: List[Tuple[Dict, List[Dict]]] = ()):
+        super().__init__(pairs)
+        self._by_user = {id(user): actions for user, actions in self}
+
+    def actions_for(self, user: Dict) -> List[Dict]:
+        """
+        Provides the actions of the user (or an empty list when the user has none).
+        """
+        return self._by_user.get(id(user), [])
+
+
+class SMTPPool:
+    """
+    Small pool of logged in SMTP servers.
+
+    Each server is replaced after sending max_per_conn messages, to stay under the
+    per-connection limits of mail providers.
+    """
+    def __init__(self, connect: Callable[[], 'SMTP'], size: int = 5, max_per_conn: int = 100):
+        if size < 1 or max_per_conn < 1:
+            # a pool without any servers would just block forever
+            raise ValueError(f"SMTPPool needs size={size} and max_per_conn={max_per_conn} to be at least 1")
+        self.connect = connect
+        self.size = size
+        self.max_per_conn = max_per_conn
+        self._slots = threading.Semaphore(size)
+        self._idle = queue.LifoQueue()  # tuple(server, messages sent)
+
+    @contextmanager
+    def acquire(self) -> Iterator['SMTP']:
+        """
+        Provides a server for sending a single message, logging in to a new one when
+        none are idle. Blocks when all `size` servers are in use.
+        """
+        with self._slots:
+            try:
+                server, count = self._idle.get_nowait()
+            except queue.Empty:
+                server, count = self.connect(), 0
+
+            try:
+                yield server
+            except BaseException:
+                # the server may be in an unknown state, so do not re-use it
+                self._quit(server)
+                raise
+
+            count += 1
+            if count >= self.max_per_conn:
+                self._quit(server)
+            else:
+                self._idle.put((server, count))
+
+    def check(self) -> None:
+        """
+        Drops any idle servers that no longer respond.
+        """
+        from smtplib import SMTPException
+
+        alive = []
+        while not self._idle.empty():
+            server, count = self._idle.get_nowait()
+            try:
+                if server.noop()[0] == 250:
+                    alive.append((server, count))
+                    continue
+            except (SMTPException, OSError):
+                pass
+            self._quit(server)
+
+        for item in reversed(alive):
+            self._idle.put(item)
+        return
+
+    def close(self) -> None:
+        """
+        Logs out of all the idle servers.
+        """
+        while not self._idle.empty():
+            server, _ = self._idle.get_nowait()
+            self._quit(server)
+        return
+
+    def _quit(self, server: 'SMTP') -> None:
+        from smtplib import SMTPException
+
+        try:
+            server.quit()
+        except (SMTPException, OSError):
+            server.close()
+        return
+
+
+class WorkbookCache:
+    """
+    The opened Excel files, kept (and re-used) until the file gets modified.
+
+    An opened workbook holds the file open, so each workbook gets closed when it is replaced
+    by a newer version of the file, or dropped to keep at most size workbooks.
+    """
+    def __init__(self, size: int = 4):
+        self.size = size
+        self._lock = threading.Lock()
+        self._workbooks = OrderedDict()  # (path, mtime) to the ExcelFile, the oldest first
+
+    def get(self, path: str, mtime: int) -> 'ExcelFile':
+        from pandas import ExcelFile
+
+        with self._lock:
+            workbook = self._workbooks.pop((path, mtime), None)
+            if workbook is None:
+                # an older version of the file is not needed anymore
+                for key in [_ for _ in self._workbooks if _[0] == path]:
+                    self._workbooks.pop(key).close()
+                workbook = ExcelFile(path, engine=EXCEL_ENGINE)
+            self._workbooks[(path, mtime)] = workbook
+            while len(self._workbooks) > self.size:
+                _, oldest = self._workbooks.popitem(last=False)
+                oldest.close()
+            return workbook
+
+    def close(self) -> None:
+        """
+        Closes all the workbooks.
+        """
+        with self._lock:
+            while self._workbooks:
+                _, workbook = self._workbooks.popitem()
+                workbook.close()
+        return
+
+
+WORKBOOKS = WorkbookCache()
+atexit.register(WORKBOOKS.close)
+
+
 class SafeConfigParser(ConfigParser):
     """
     Class with a get that does NOT throw when item does NOT exist
@@ -77,6 +270,15 @@ class SafeConfigParser(ConfigParser):
             return ''
         return super().get(section, option, raw=raw, **kwargs)
 
+    def section(self, section: str) -> Dict[str, str]:
+        """
+        Provides all the (raw) options in the section, or an empty dictionary when the
+        section does NOT exist.
+        """
+        if not self.has_section(section):
+            return {}
+        return dict(self.items(section, raw=True))
+
 
 ###############################################################################
 # Function definitions
@@ -102,6 +304,13 @@ class Reminders:
         self.msg_table_headers = None
         self.msg_table_align = None
         self.msg_close = None
+        self.mail_connections = 1
+        self.mail_max_per_connection = 100
+        self.cache_dir = None
+        self._password = None
+        self._pool = None
+        self._table_template = None
+        self._table_key = None
 
     def parse_args(self, *args) -> argparse.Namespace:
         """
@@ -143,6 +352,11 @@ class Reminders:
             action="store_true",
             help="Interactive mode allows viewing per user data before sending."
         )
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help=f"Cache the parsed spreadsheet in {CACHE_DIR} to speed up later runs.",
+        )
         return parser.parse_args(*args)
 
     def print(self, *args, **kwargs) -> None:
@@ -151,34 +365,56 @@ class Reminders:
         """
         print(*args, **kwargs)
 
-    def parse_config(self, filename: str) -> None:
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _read_config(path: str, mtime: int) -> SafeConfigParser:
+        """
+        Parses the config file, which is kept (and re-used) until the file gets modified.
+        """
         config = SafeConfigParser()
-        config.read(filename)
-        self.update_config(config)
+        config.read(path)
+        return config
+
+    def parse_config(self, filename: str) -> None:
+        path = Path(filename)
+        if not path.is_file():
+            # like ConfigParser.read(), a missing file is just an empty config
+            self.update_config(SafeConfigParser())
+            return
+        self.update_config(self._read_config(str(path.resolve()), path.stat().st_mtime_ns))
 
     def update_config(self, config: SafeConfigParser) -> None:
-        self.spreadsheet = config.get(CSECT_SOURCE, 'spreadsheet') or self.spreadsheet
-        self.tab_user = config.get(CSECT_SOURCE, 'tab_users') or self.tab_user
-        self.tab_action = config.get(CSECT_SOURCE, 'tab_actions') or self.tab_action
-        self.hdr_user = config.get(CSECT_SOURCE, 'user_id') or self.hdr_user
-        self.hdr_email = config.get(CSECT_SOURCE, 'email_addr') or self.hdr_email
-        self.hdr_id = config.get(CSECT_SOURCE, 'action_id') or self.hdr_id
-        self.hdr_due = config.get(CSECT_SOURCE, 'action_due') or self.hdr_due
-        self.hdr_status = config.get(CSECT_SOURCE, 'action_status') or self.hdr_status
-
-        self.mail_server = config.get(CSECT_EMAIL, 'server') or self.mail_server
-        self.mail_port = config.get(CSECT_EMAIL, 'port') or self.mail_port
-        self.mail_password = config.get(CSECT_EMAIL, 'password') or self.mail_password
-        self.mail_from = config.get(CSECT_EMAIL, 'from') or self.mail_from
-        self.mail_subject = config.get(CSECT_EMAIL, 'subject') or self.mail_subject
-        self.mail_cc = [_.strip() for _ in config.get(CSECT_EMAIL, 'cc').split(',') if _.strip()] or self.mail_cc
-
-        self.msg_preamble = config.get(CSECT_MSG, 'preamble') or self.msg_preamble
-        self.msg_close = config.get(CSECT_MSG, 'close') or self.msg_close
+        # read each section once, instead of looking up every option in the parser
+        source = config.section(CSECT_SOURCE)
+        email = config.section(CSECT_EMAIL)
+        msg = config.section(CSECT_MSG)
+
+        self.spreadsheet = source.get('spreadsheet') or self.spreadsheet
+        self.tab_user = source.get('tab_users') or self.tab_user
+        self.tab_action = source.get('tab_actions') or self.tab_action
+        self.hdr_user = source.get('user_id') or self.hdr_user
+        self.hdr_email = source.get('email_addr') or self.hdr_email
+        self.hdr_id = source.get('action_id') or self.hdr_id
+        self.hdr_due = source.get('action_due') or self.hdr_due
+        self.hdr_status = source.get('action_status') or self.hdr_status
+
+        self.mail_server = email.get('server') or self.mail_server
+        self.mail_port = email.get('port') or self.mail_port
+        self.mail_password = email.get('password') or self.mail_password
+        self.mail_from = email.get('from') or self.mail_from
+        self.mail_subject = email.get('subject') or self.mail_subject
+        self.mail_connections = int(email.get('connections') or self.mail_connections)
+        self.mail_max_per_connection = int(email.get('messages_per_connection') or self.mail_max_per_connection)
+        if self.mail_connections < 1 or self.mail_max_per_connection < 1:
+            raise ValueError(f"The {CSECT_EMAIL}/connections and messages_per_connection options must be at least 1")
+        self.mail_cc = [_.strip() for _ in email.get('cc', '').split(',') if _.strip()] or self.mail_cc
+
+        self.msg_preamble = msg.get('preamble') or self.msg_preamble
+        self.msg_close = msg.get('close') or self.msg_close
         self.msg_table_headers = [
-            _.strip() for _ in config.get(CSECT_MSG, 'columns').split(',') if _.strip()
+            _.strip() for _ in msg.get('columns', '').split(',') if _.strip()
         ] or self.msg_table_headers
-        avalues = [_.strip() for _ in config.get(CSECT_MSG, 'align').split(',') if _.strip()]
+        avalues = [_.strip() for _ in msg.get('align', '').split(',') if _.strip()]
         if avalues:
             self.msg_table_align = {}
             for a in avalues:
@@ -217,76 +453,216 @@ class Reminders:
             errors += ["Missing mail from address"]
         if not self.mail_subject:
             errors += ["Missing mail subject"]
+        if self.mail_connections < 1 or self.mail_max_per_connection < 1:
+            errors += ["Mail connections and messages per connection must be at least 1"]
         if not self.msg_table_headers:
             errors += ["Missing message table headers"]
         # TODO: check that preamble and closing exist?
         return errors
 
+    @staticmethod
+    def _load_workbook(path: str, mtime: int) -> 'ExcelFile':
+        """
+        Opens the Excel file, which is kept (and re-used) until the file gets modified.
+        """
+        return WORKBOOKS.get(path, mtime)
+
+    def _parse_frames(self, filename: str, sheetnames: List[str]) -> Dict[str, 'DataFrame']:
+        """
+        Does the work of read_frames() (without any caching).
+        """
+        from pandas import read_excel
+        from pandas.api.types import is_datetime64_any_dtype
+
+        # declaring the known text columns avoids the per-column type inference
+        text_fields = [self.hdr_user, self.hdr_email, self.hdr_id, self.hdr_status]
+        dtype = {_: str for _ in text_fields if _}
+        workbook = self._load_workbook(str(Path(filename).resolve()), Path(filename).stat().st_mtime_ns)
+        user_sheets = [_ for _ in sheetnames if _ == self.tab_user]
+        other_sheets = [_ for _ in sheetnames if _ != self.tab_user]
+        parsed = {}
+        if user_sheets:
+            # user values are only searched/substituted as text, so read them that way (no NaT/nan/123.0)
+            parsed.update(read_excel(workbook, sheet_name=user_sheets, dtype=str))
+        if other_sheets:
+            parsed.update(read_excel(workbook, sheet_name=other_sheets, dtype=dtype or None))
+
+        frames = {}
+        for sheetname in sheetnames:
+            frame = frames[sheetname] = parsed[sheetname]
+            if sheetname == self.tab_user:
+                frame = frames[sheetname] = frame.fillna('').astype(str)
+            else:
+                fields = [_ for _ in frame.columns if not is_datetime64_any_dtype(frame[_].dtype)]
+                frame[fields] = frame[fields].fillna('')
+            frame[ROW_HEADER] = [f"{sheetname}:{row}" for row in range(1, len(frame) + 1)]
+
+        return frames
+
+    def read_frames(self, filename: str, sheetnames: List[str]) -> Dict[str, 'DataFrame']:
+        """
+        Open the Excel file once and parse each of the specified sheets to a DataFrame,
+        with an additional ROW_HEADER column identifying the sheet and row of each item.
+
+        Empty cells are '' (except in date columns), and all the user values are strings.
+
+        When there is a cache_dir, the parsed sheets are kept there (one file per spreadsheet)
+        and re-used until the hash of the spreadsheet contents (or reading options, pandas
+        version, or Excel engine) changes.
+
+        Returns a dictionary of the sheet name to the DataFrame.
+        """
+        if not self.cache_dir:
+            return self._parse_frames(filename, sheetnames)
+
+        from pandas import __version__ as pandas_version
+
+        with open(filename, 'rb') as fp:
+            digest = hashlib.blake2b(fp.read())
+        options = (
+            sheetnames, self.tab_user, self.hdr_user, self.hdr_email, self.hdr_id, self.hdr_status,
+            pandas_version, EXCEL_ENGINE, CACHE_VERSION,
+        )
+        digest.update(repr(options).encode())
+        name = hashlib.blake2b(str(Path(filename).resolve()).encode(), digest_size=16).hexdigest()
+        cache = Path(self.cache_dir) / f"{name}.pickle"
+        try:
+            with open(cache, 'rb') as fp:
+                cached_digest, frames = pickle.load(fp)
+            if cached_digest == digest.hexdigest():
+                return frames
+        except Exception:
+            # anything from a missing file to one pickled by another pandas version
+            pass  # just parse the spreadsheet again
+
+        frames = self._parse_frames(filename, sheetnames)
+        try:
+            cache.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache, 'wb') as fp:
+                pickle.dump((digest.hexdigest(), frames), fp)
+        except OSError:
+            pass  # caching is only an optimization
+        return frames
+
+    def read_sheets(self, filename: str, sheetnames: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Open the Excel file once and parse the items in each of the specified sheets to a
+        list of dictionaries, where the dictionary property names align with the sheet
+        header column strings.
+
+        Returns a dictionary of the sheet name to the list of items.
+        """
+        frames = self.read_frames(filename, sheetnames)
+        return {name: frame.to_dict(orient='records') for name, frame in frames.items()}
+
     def sheet_to_dict(self, filename: str, sheetname: str) -> List[Dict]:
         """
         Open the Excel file and parse the items in the specified sheet to a list of
         dictionaries, where the dictionary property names align with the sheet header
         column strings.
         """
-        with ExcelFile(filename) as xls:
-            sheet = xls.parse(sheetname)
-            values = sheet.to_dict()
-            headers = values.keys()
-            num_values = max([len(_.keys()) for _ in values.values()])
-
-            result = []
-            for row in range(num_values):
-                item = {k: values.get(k, {}).get(row, '') for k in headers}
-                item[ROW_HEADER] = f"{sheetname}:{row + 1}"
-                result.append(item)
+        return self.read_sheets(filename, [sheetname])[sheetname]
 
-            return result
-
-    def find_user(self, users: List[Dict], username: str) -> Dict:
+    def _build_user_index(self, users: List[Dict]) -> UserIndex:
         """
-        Search the whole list of users to find a user who has something in a field that matches (case-insensitive)
+        Casefolds the searchable values of each user once, so repeated searches do not
+        need to walk (and casefold) every field of every user. Only the string values are
+        searchable (others, like numbers, are skipped).
+
+        The tokens map each (casefolded) value, the '/', ',' or whitespace separated parts
+        of each value, and the local part of the email address to the users that have them. The
+        values of all the users are joined (with a NUL, so a search cannot match across fields
+        or users) into one text, so a search is a single find() instead of one per user.
         """
-        matches = []
-        searchname = username.lower().strip()
+        tokens = {}
+        starts = []
+        text = []
+        offset = 0
         for user in users:
-            for v in user.values():
-                if not isinstance(v, str):
-                    continue
-
-                if searchname in v.lower():
-                    # if we find a match, break out of the inner loop
-                    matches.append(user)
-                    break
+            values = [v.casefold() for v in user.values() if isinstance(v, str)]
+            keys = set()
+            for v in values:
+                keys.add(v.strip())
+                keys.update(TOKEN_RE.split(v))
+            email = user.get(self.hdr_email)
+            if isinstance(email, str) and '@' in email:
+                keys.add(email.casefold().split('@')[0].strip())
+            keys.discard('')
+            for k in keys:
+                tokens.setdefault(k, []).append(user)
+            values = '\0'.join(values) + '\0'
+            starts.append(offset)
+            text.append(values)
+            offset += len(values)
+
+        return UserIndex(tokens, list(users), starts, ''.join(text))
+
+    def _find_indexed_user(self, index: UserIndex, username: str) -> Dict:
+        """
+        Search the user index to find a user who has something in a field that matches (case-insensitive)
 
-        if not matches:
+        A user with a value (or token) that exactly matches is preferred over users that
+        only contain the username somewhere in a field.
+        """
+        searchname = username.casefold().strip()
+        hits = index.tokens.get(searchname)
+        if hits:
+            if len(hits) > 1:
+                raise AmbiguousUser(username, [_.get(ROW_HEADER) for _ in hits])
+            return hits[0]
+
+        found = index.text.find(searchname)
+        if found < 0 or not index.users:
             return None
+        which = bisect.bisect_right(index.starts, found) - 1
+        match = index.users[which]
+
+        # any later match is in another user, and no need to look any further than that
+        if which + 1 < len(index.users):
+            found = index.text.find(searchname, index.starts[which + 1])
+            if found >= 0:
+                other = index.users[bisect.bisect_right(index.starts, found) - 1]
+                raise AmbiguousUser(username, [match.get(ROW_HEADER), other.get(ROW_HEADER)])
 
-        if len(matches) > 1:
-            raise AmbiguousUser(username, [_.get(ROW_HEADER) for _ in matches])
+        return match
 
-        return matches[0]
+    def find_user(self, users: List[Dict], username: str) -> Dict:
+        """
+        Search the whole list of users to find a user who has something in a field that matches (case-insensitive)
+        """
+        return self._find_indexed_user(self._build_user_index(users), username)
 
-    def correlate(self, users: List[Dict], actions: List[Dict]) -> List[Tuple[Dict, List[Dict]]]:
+    def correlate(
+        self, users: List[Dict], actions: List[Dict], index: UserIndex = None
+    ) -> Correlation:
         """
-        Organizes the actions by user. It returns a list of tuples(user, list(actions))
+        Organizes the actions by user. It returns a list of tuples(user, list(actions)), that
+        can also look up the actions of a given user.
+
+        To avoid issues with hashing a dictionary, the actions are collected by the identity
+        of each user, and converted to a list of tuples (in the order the users were first
+        assigned an action) as the last step.
 
-        To avoid issues with hashing a dictionary, a Tuple is used. However, to collect
-        the items for a given tuple, a dictionary is used internally and converted to a
-        list of tuples as the last step.
+        The index (from _build_user_index) can be provided when the caller also needs it.
         """
-        uname_actions = {}
+        if index is None:
+            index = self._build_user_index(users)
+        found = {}  # username (as written in the action) to user
+        buckets = {}  # id(user) to tuple(user, list(actions))
         for action in actions:
             for username in action.get(self.hdr_user).split('/'):
-                user = self.find_user(users, username)
+                user = found.get(username)
                 if not user:
-                    raise MissingUser(username, action.get(self.hdr_id), action.get(ROW_HEADER))
-                uname = user.get(self.hdr_user)
-                uact = uname_actions.get(uname, [])
-                uact.append(action)
-                uname_actions.update({uname: uact})
+                    user = self._find_indexed_user(index, username)
+                    if not user:
+                        raise MissingUser(username, action.get(self.hdr_id), action.get(ROW_HEADER))
+                    found[username] = user
+                bucket = buckets.get(id(user))
+                if bucket is None:
+                    bucket = buckets[id(user)] = (user, [])
+                bucket[1].append(action)
 
-        # convert the internal uname_actions dictionary into a list of tuple(user, list(actions))
-        return [(self.find_user(users, uname), uact) for uname, uact in uname_actions.items()]
+        return Correlation(buckets.values())
 
     def _format(self, value: Any) -> str:
         """
@@ -297,14 +673,6 @@ class Reminders:
             value = str(value.date())
         return str(value)
 
-    def _get_time(self, value: datetime.datetime) -> Optional[datetime.date]:
-        """
-        Pulls the date out of the provided value
-        """
-        if isinstance(value, datetime.datetime):
-            return value.date()
-        return None
-
     def substitute(self, template: str, user: Dict, days: int) -> str:
         """
         Substitutes the {}'s in the template with either the days, or a value
@@ -314,31 +682,54 @@ class Reminders:
         If the field name does not exist in user (and not equal to 'days'), a ValueError
         is raised (instead of sending email with an unknown/missing value)
         """
-        def new_value(group: str) -> str:
-            # the group includes the braces, so trim to avoid the braces
-            v = group[1:-1]
-            if v == 'days':
-                return str(days)
-            if v in user:
-                return user.get(v)
-            raise ValueError(f"Missing user field='{v}'")
+        values = TemplateValues(user)
+        values['days'] = days
+        return FIELD_RE.sub(lambda match: str(values[match.group(1)]), template)
 
-        return FIELD_RE.sub(lambda m: new_value(m.group()), template)
+    def _make_table_template(self) -> prettytable.PrettyTable:
+        """
+        Provides an (empty) table with the headers and alignment configured.
+
+        The table is kept for re-use, and only rebuilt when the headers or alignment change.
+        """
+        align = self.msg_table_align or {}
+        key = (tuple(self.msg_table_headers), tuple(align.items()))
+        if self._table_key != key:
+            table = prettytable.PrettyTable()
+            table.field_names = self.msg_table_headers
+            # horizontal alignment can be overridden
+            for h, v in align.items():
+                table.align[h] = v
+            self._table_template = table
+            self._table_key = key
+        return self._table_template
 
     def _create_table(self, actions: List[Dict], fmt: Format) -> str:
         """
         Creates a formatted table out of the list of actions.
+
+        The CSV and JSON tables are written directly (the same way PrettyTable does), so
+        they do not need the shared table.
         """
-        table = prettytable.PrettyTable()
-        table.field_names = self.msg_table_headers
-        # horizontal alignment can be overridden
-        for h, v in self.msg_table_align.items():
-            table.align[h] = v
+        headers = self.msg_table_headers
+        format_value = self._format
+        # remove the time, and turn the datetime value into a string
+        rows = [[format_value(item.get(h)) for h in headers] for item in actions]
 
-        for item in actions:
-            # remove the time, and turn the datetime value into a string
-            values = [self._format(item.get(h)) for h in self.msg_table_headers]
-            table.add_row(values)
+        if fmt == Format.CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(headers)
+            writer.writerows(rows)
+            return buffer.getvalue()
+        if fmt == Format.JSON:
+            objects = [list(headers)] + [dict(zip(headers, row)) for row in rows]
+            return json.dumps(objects, indent=4, separators=(',', ': '), sort_keys=True)
+
+        # the tables are rendered before any sending threads start, so the table can be shared
+        table = self._make_table_template()
+        table.clear_rows()
+        table.add_rows(rows)
 
         if fmt == Format.HTML:
             return table.get_html_string(
@@ -348,31 +739,66 @@ class Reminders:
                 vrules=prettytable.ALL,
                 format=True,
             )
-        if fmt == Format.CSV:
-            return table.get_csv_string()
-        if fmt == Format.JSON:
-            return table.get_json_string()
         return table.get_string()
 
-    def get_email_server(self) -> SMTP:
+    def get_email_server(self) -> 'SMTP':
         """
         Simple "utility" to log into a mail server
         """
-        # log into the email server once
-        password = self.mail_password or getpass(f"{self.mail_from} email password:")
-        server = SMTP(self.mail_server, self.mail_port)
+        from smtplib import SMTP
+
+        password = self.get_email_password()
+        server = SMTP(self.mail_server, int(self.mail_port))
         server.starttls()
         server.login(self.mail_from, password)
         return server
 
-    def send_email_via_server(self, server: SMTP, user: Dict, actions: List[Dict], days: int) -> None:
+    def get_email_password(self) -> str:
         """
-        Formats the message to the user, and sends it using the server.
+        Provides the mail password, which is only prompted for once (when not configured).
         """
+        self._password = self._password or self.mail_password or getpass(f"{self.mail_from} email password:")
+        return self._password
+
+    def get_email_pool(self) -> SMTPPool:
+        """
+        Provides the pool of mail servers.
+
+        The pool is kept for re-use (e.g. by later runs), so any idle servers are checked
+        before handing it out again. It gets closed when the program exits.
+        """
+        if self._pool:
+            self._pool.check()
+            return self._pool
+
+        # get the password here, so the servers (maybe connected by several threads) never prompt
+        self.get_email_password()
+        self._pool = SMTPPool(self.get_email_server, self.mail_connections, self.mail_max_per_connection)
+        atexit.register(self.close_email_pool)
+        return self._pool
+
+    def close_email_pool(self) -> None:
+        """
+        Logs out of all the mail servers (when logged in).
+        """
+        pool = self._pool
+        self._pool = None
+        atexit.unregister(self.close_email_pool)
+        if pool:
+            pool.close()
+        return
+
+    def _render_message(self, user: Dict, table: str, days: int) -> Tuple[str, List[str], bytes]:
+        """
+        Formats the message to the user around the (HTML) table of actions.
+
+        Returns the sender, the list of recipients, and the message ready to be sent.
+        """
+        from email.mime.text import MIMEText
+
         to_user = user.get(self.hdr_email)
         intro = self.substitute(self.msg_preamble, user, days)
         closing = self.substitute(self.msg_close, user, days)
-        table = self._create_table(actions, Format.HTML)
         body = f"{intro}{table}{closing}"
         to = [to_user]
         if isinstance(self.mail_cc, str):
@@ -380,13 +806,46 @@ class Reminders:
         elif isinstance(self.mail_cc, list):
             to.extend(self.mail_cc)
 
-        message = MIMEMultipart("alternative")
+        # there is only the HTML part, so no need for a multipart message
+        message = MIMEText(body, "html")
         message['Subject'] = self.mail_subject
         message['From'] = self.mail_from
         message['To'] = to_user
-        message['CC'] = self.mail_cc
-        message.attach(MIMEText(body, "html"))
-        server.sendmail(self.mail_from, to, message.as_string())
+        if len(to) > 1:
+            message['CC'] = ', '.join(to[1:])
+        return self.mail_from, to, message.as_bytes()
+
+    def _render_messages(
+        self, user_actions: List[Tuple[Dict, List[Dict]]], days: int
+    ) -> List[Tuple[Dict, str, List[str], bytes]]:
+        """
+        Formats the messages to all the users up front, so sending only needs to talk to the server.
+
+        Returns a list of tuple(user, sender, recipients, message).
+        """
+        tables = {}
+        messages = []
+        for (user, actions) in user_actions:
+            # users with the same actions get the same table
+            key = tuple(id(_) for _ in actions)
+            if key not in tables:
+                tables[key] = self._create_table(actions, Format.HTML)
+            messages.append((user, *self._render_message(user, tables[key], days)))
+        return messages
+
+    def _send_message(self, pool: SMTPPool, sender: str, to: List[str], message: bytes) -> None:
+        """
+        Sends the formatted message using a server from the pool.
+        """
+        with pool.acquire() as server:
+            server.sendmail(sender, to, message)
+        return
+
+    def send_email_via_server(self, pool: SMTPPool, user: Dict, actions: List[Dict], days: int) -> None:
+        """
+        Formats the message to the user, and sends it using a server from the pool.
+        """
+        self._send_message(pool, *self._render_message(user, self._create_table(actions, Format.HTML), days))
         return
 
     def send_all_emails(self, user_actions: Dict, days: int) -> None:
@@ -397,13 +856,12 @@ class Reminders:
         for (user, actions) in user_actions:
             self.print(f"    {user.get(self.hdr_user)}: {len(actions)}")
 
-        # each user gets a tailored email
-        server = self.get_email_server()
-        for (user, actions) in user_actions:
-            self.send_email_via_server(server, user, actions, days)
-
-        # close things out nicely
-        server.quit()
+        # each user gets a tailored email, sent in parallel when the pool has several servers
+        messages = self._render_messages(user_actions, days)
+        pool = self.get_email_pool()
+        workers = max(1, min(MAX_SEND_THREADS, len(messages), pool.size))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda m: self._send_message(pool, *m[1:]), messages))
         return
 
     def prompt_for_what(self, user: Dict, actions: List[Dict]) -> What:
@@ -429,24 +887,23 @@ class Reminders:
         Walks the user/actions, prompts what to do for each user, and takes the
         appropriate action.
         """
-        server = None
+        pool = None
         # each user gets a tailored email
         for (user, actions) in user_actions:
             what = self.prompt_for_what(user, actions)
             if what == What.EXIT:
                 break
             if what == What.EMAIL:
-                server = server or self.get_email_server()
-                self.send_email_via_server(server, user, actions, days)
+                pool = pool or self.get_email_pool()
+                self.send_email_via_server(pool, user, actions, days)
 
         self.print('No more users')
-
-        if server:
-            server.quit()
         return
 
-    def get_fields(self, string: str) -> Set[str]:
-        return set([_.replace('{', '').replace('}', '') for _ in FIELD_RE.findall(string)])
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_fields(string: str) -> FrozenSet[str]:
+        return frozenset(FIELD_RE.findall(string))
 
     def valid_string(self, value: Any) -> bool:
         if isinstance(value, str):
@@ -457,46 +914,107 @@ class Reminders:
         if isinstance(value, datetime.date):
             return True
         return False
-        
-    def validate_users(self, users: List[Dict]) -> List[str]:
+
+    def _missing_strings(self, frame: 'DataFrame', field: str) -> 'Series':
+        """
+        Provides a mask of the rows where the field is not a (non-empty) string.
+        """
+        from pandas import Series
+        from pandas import StringDtype
+
+        if field not in frame:
+            return Series(True, index=frame.index)
+        values = frame[field]
+        if isinstance(values.dtype, StringDtype):
+            return values.fillna('').eq('')
+        return ~values.map(self.valid_string).astype(bool)
+
+    def _missing_dates(self, frame: 'DataFrame', field: str) -> 'Series':
+        """
+        Provides a mask of the rows where the field is not a date.
+        """
+        from pandas import Series
+        from pandas.api.types import is_datetime64_any_dtype
+
+        if field not in frame:
+            return Series(True, index=frame.index)
+        values = frame[field]
+        if is_datetime64_any_dtype(values.dtype):
+            return values.isna()
+        return ~values.map(self.valid_date).astype(bool)
+
+    def _missing_fields(
+        self, items: Union['DataFrame', List[Dict]], fields: Set[str]
+    ) -> Tuple['DataFrame', Dict[Any, Set[str]]]:
+        """
+        Provides the items as a DataFrame, and the fields missing from each row (only the
+        rows missing something are included).
+
+        All the rows of a DataFrame have the same columns, but each dictionary in a list
+        can be missing its own fields (which would just be NaN after the conversion).
+        """
+        from pandas import DataFrame
+
+        if isinstance(items, DataFrame):
+            missing = fields - set(items.columns)
+            return items, {index: missing for index in items.index} if missing else {}
+
+        missing = {}
+        for index, item in enumerate(items):
+            absent = fields - item.keys()
+            if absent:
+                missing[index] = absent
+        return DataFrame(items), missing
+
+    def validate_users(self, users: Union['DataFrame', List[Dict]]) -> List[str]:
         """
         Verifies all users have all "required" fields
+
+        The checks are done a column at a time, so only users with errors are visited.
         """
-        fields = self.get_fields(self.msg_preamble) | self.get_fields(self.msg_close)
+        fields = set(self.get_fields(self.msg_preamble) | self.get_fields(self.msg_close))
         fields.discard('days')  # not part of user record
         fields.discard(self.hdr_email)  # already check for missing email
+        users, missing = self._missing_fields(users, fields)
+        no_email = self._missing_strings(users, self.hdr_email)
 
         errors = []
-        for user in users:
+        invalid = users[no_email | users.index.isin(list(missing))]
+        for index, user in invalid.to_dict(orient='index').items():
             reasons = []
-            if not self.valid_string(user.get(self.hdr_email)):
+            if no_email[index]:
                 reasons.append('missing email')
-            missing = fields - user.keys()
-            if missing:
-                reasons.append(f"missing email fields {'/'.join(sorted(missing))}")
-            if reasons:
-                errors.append(f"{user.get(self.hdr_user)} ({user.get(ROW_HEADER)}) error(s): {', '.join(reasons)}")
+            if index in missing:
+                reasons.append(f"missing email fields {'/'.join(sorted(missing[index]))}")
+            errors.append(f"{user.get(self.hdr_user)} ({user.get(ROW_HEADER)}) error(s): {', '.join(reasons)}")
 
         return errors
 
-    def validate_actions(self, actions: List[Dict]) -> List[str]:
+    def validate_actions(self, actions: Union['DataFrame', List[Dict]]) -> List[str]:
+        """
+        Verifies all actions have all "required" fields
+
+        The checks are done a column at a time, so only actions with errors are visited.
+        """
         fields = set(self.msg_table_headers)
         # remove the important fields we already check for (to avoid redundant errors)
         fields.discard(self.hdr_user)
         fields.discard(self.hdr_due)
+        actions, missing = self._missing_fields(actions, fields)
+        no_user = self._missing_strings(actions, self.hdr_user)
+        no_due = self._missing_dates(actions, self.hdr_due)
 
         errors = []
-        for action in actions:
+        invalid = actions[no_user | no_due | actions.index.isin(list(missing))]
+        for index, action in invalid.to_dict(orient='index').items():
             reasons = []
-            if not self.valid_string(action.get(self.hdr_user)):
+            if no_user[index]:
                 reasons.append('missing assignment')
-            if not self.valid_date(action.get(self.hdr_due)):
+            if no_due[index]:
                 reasons.append('missing due date')
-            missing = fields - action.keys()
-            if missing:
-                reasons.append(f"missing table fields {'/'.join(sorted(missing))}")
-            if reasons:
-                errors.append(f"{action.get(self.hdr_id)} ({action.get(ROW_HEADER)}) error(s): {', '.join(reasons)}")
+            if index in missing:
+                reasons.append(f"missing table fields {'/'.join(sorted(missing[index]))}")
+            errors.append(f"{action.get(self.hdr_id)} ({action.get(ROW_HEADER)}) error(s): {', '.join(reasons)}")
 
         return errors
 
@@ -506,6 +1024,8 @@ class Reminders:
         """
         args = self.parse_args(*sysargs)
         days = args.days
+        if args.cache:
+            self.cache_dir = CACHE_DIR
 
         if args.config:
             config = Path(args.config)
@@ -524,34 +1044,43 @@ class Reminders:
             self.print(f"{spreadsheet} is not a file!")
             return 1
 
-        users = self.sheet_to_dict(str(spreadsheet), self.tab_user)
-        errors = self.validate_users(users)
+        frames = self.read_frames(str(spreadsheet), [self.tab_user, self.tab_action])
+        errors = self.validate_users(frames[self.tab_user])
         if errors:
             self.print(f"Invalid users: {NL}{NL.join(errors)}")
             return 2
 
-        actions = self.sheet_to_dict(str(spreadsheet), self.tab_action)
+        actions = frames[self.tab_action]
         errors = self.validate_actions(actions)
         if errors:
             self.print(f"Invalid actions: {NL}{NL.join(errors)}")
             return 3
 
         # start by filtering out non-Open items... may contain users no longer in the system
-        actions = [_ for _ in actions if _.get(self.hdr_status) == 'Open']
+        if self.hdr_status in actions:
+            actions = actions[actions[self.hdr_status] == 'Open']
+        else:
+            actions = actions.iloc[0:0]  # nothing is Open without a status
 
         # remove actions not due, before correlating with by users
         before = datetime.datetime.now() + datetime.timedelta(days=days)
-        actions = [_ for _ in actions if _.get(self.hdr_due) < before]
+        actions = actions[actions[self.hdr_due] < before]
 
-        # sort by time here, so it is displayed in order
-        actions = sorted(actions, key=lambda i: self._get_time(i[self.hdr_due]))
+        # sort by date (ignoring the time) here, so it is displayed in order
+        # (pandas is imported late, so --help and config/file errors never load it)
+        from pandas import to_datetime
+        actions = actions.sort_values(self.hdr_due, key=lambda due: to_datetime(due).dt.normalize(), kind='stable')
+        actions = actions.to_dict(orient='records')
+        users = frames[self.tab_user].to_dict(orient='records')
 
-        user_actions = self.correlate(users, actions)
+        index = self._build_user_index(users)
+        user_actions = self.correlate(users, actions, index)
 
         # reduce the list to focus only on the specified people
         if args.person:
-            user = self.find_user(users, args.person)
-            user_actions = [(u, a) for (u, a) in user_actions if u == user]
+            user = self._find_indexed_user(index, args.person)
+            items = user_actions.actions_for(user)
+            user_actions = [(user, items)] if items else []
 
         # check after filtering
         if not user_actions:
@@ -22,3 +22,9 @@ class TestConfig(unittest.TestCase):
 
         # we get back the hash value
         self.assertEqual('#bar', uut.get('sna', 'foo'))
+
+    def test_config_section(self):
+        uut = SafeConfigParser()
+        uut.read_string("[sna]\nfoo = bar\npct = 50%")
+        self.assertEqual({'foo': 'bar', 'pct': '50%'}, uut.section('sna'))  # raw, like get()
+        self.assertEqual({}, uut.section('blah'))  # section does NOT exists
@@ -1,8 +1,18 @@
+import copy
+import os
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
 import unittest
 
+from pathlib import Path
 from typing import Dict
 from typing import List
 from typing import Tuple
+from unittest.mock import Mock
 from unittest.mock import call
 from unittest.mock import patch
 
@@ -15,9 +25,19 @@ from reminders import MissingUser
 from reminders import Reminders
 from reminders import ROW_HEADER
 from reminders import SafeConfigParser
+from reminders import SMTPPool
+from reminders import WorkbookCache
 
 
 class TestReminders(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # parse the example sheets once, and each test gets a copy (since they get modified)
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        cls.example_users = uut.sheet_to_dict('example/bedrock.xlsx', 'Users')
+        cls.example_actions = uut.sheet_to_dict('example/bedrock.xlsx', 'Actions')
+
     def test_reminders_sheet_to_dict_errors(self):
         uut = Reminders()
         self.assertRaises(FileNotFoundError, lambda: uut.sheet_to_dict('foo', 'bar'))
@@ -51,6 +71,134 @@ class TestReminders(unittest.TestCase):
         self.assertEqual('fred@slaterockandgravel.com', first.get('Email'))
         self.assertEqual('FF', first.get('Aliases'))
         self.assertEqual('Users:1', first.get('_row'))
+        self.assertEqual('', items[3].get('Aliases'))  # empty cell
+
+    def test_reminders_sheet_to_dict_blank_user_cells(self):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        users = uut.sheet_to_dict('resources/blank_users.xlsx', 'Users')
+        self.assertEqual(3, len(users))
+        for user in users:
+            self.assertEqual(set([str]), set(type(_) for _ in user.values()))
+
+        # blank cells are empty strings (not NaT/nan), and numbers stay as written
+        fred, wilma, barney = users
+        self.assertEqual('123', fred.get('Phone'))
+        self.assertEqual('4.5', barney.get('Phone'))
+        self.assertEqual('2020-01-02 00:00:00', fred.get('Start'))
+        self.assertEqual('', wilma.get('Phone'))
+        self.assertEqual('', wilma.get('Start'))
+        self.assertEqual(None, uut.find_user(users, 'nat'))
+        self.assertEqual(None, uut.find_user(users, 'nan'))
+
+    def test_reminders_read_sheets(self):
+        uut = Reminders()
+        sheets = uut.read_sheets('example/bedrock.xlsx', ['Users', 'Actions'])
+        self.assertEqual(set(['Users', 'Actions']), set(sheets.keys()))
+        self.assertEqual(uut.sheet_to_dict('example/bedrock.xlsx', 'Users')[0], sheets['Users'][0])
+        self.assertEqual('Actions:4', sheets['Actions'][3].get(ROW_HEADER))
+        self.assertRaises(ValueError, lambda: uut.read_sheets('example/bedrock.xlsx', ['Users', 'bar']))
+
+    def test_reminders_load_workbook(self):
+        uut = Reminders()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = str(Path(shutil.copy('example/bedrock.xlsx', tmpdir)).resolve())
+            uut.sheet_to_dict(filename, 'Users')
+            workbook = uut._load_workbook(filename, os.stat(filename).st_mtime_ns)
+            uut.sheet_to_dict(filename, 'Actions')
+            self.assertIs(workbook, uut._load_workbook(filename, os.stat(filename).st_mtime_ns))
+
+            # modifying the file gets a new workbook
+            mtime = os.stat(filename).st_mtime_ns + 1000000000
+            os.utime(filename, ns=(mtime, mtime))
+            self.assertEqual(4, len(uut.sheet_to_dict(filename, 'Users')))
+            self.assertIsNot(workbook, uut._load_workbook(filename, mtime))
+
+    @patch('pandas.ExcelFile', side_effect=lambda *args, **kwargs: Mock())
+    def test_reminders_workbook_cache(self, mock_excel):
+        uut = WorkbookCache(size=2)
+        first = uut.get('a.xlsx', 1)
+        self.assertIs(first, uut.get('a.xlsx', 1))
+
+        # a newer version of the file replaces (and closes) the older one
+        second = uut.get('a.xlsx', 2)
+        self.assertIsNot(first, second)
+        first.close.assert_called_once()
+
+        # the least recently used workbook gets closed to make room
+        other = uut.get('b.xlsx', 1)
+        self.assertIs(second, uut.get('a.xlsx', 2))
+        third = uut.get('c.xlsx', 1)
+        other.close.assert_called_once()
+        second.close.assert_not_called()
+
+        # and everything gets closed at the end
+        uut.close()
+        second.close.assert_called_once()
+        third.close.assert_called_once()
+        self.assertEqual(4, mock_excel.call_count)
+
+    def test_reminders_read_config(self):
+        uut = Reminders()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = str(Path(shutil.copy('example/config.ini', tmpdir)).resolve())
+            uut.parse_config(filename)
+            config = uut._read_config(filename, os.stat(filename).st_mtime_ns)
+            self.assertIs(config, uut._read_config(filename, os.stat(filename).st_mtime_ns))
+
+            # modifying the file gets re-read
+            Path(filename).write_text(Path(filename).read_text().replace('bedrock.xlsx', 'other.xlsx'))
+            mtime = os.stat(filename).st_mtime_ns + 1000000000
+            os.utime(filename, ns=(mtime, mtime))
+            uut.parse_config(filename)
+            self.assertEqual('other.xlsx', uut.spreadsheet)
+
+        # a missing file is not an error
+        uut = Reminders()
+        uut.parse_config('example/no-such-config.ini')
+        self.assertEqual(None, uut.spreadsheet)
+
+    def test_reminders_read_frames_cache(self):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        sheets = ['Users', 'Actions']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            uut.cache_dir = tmpdir
+            frames = uut.read_frames('example/bedrock.xlsx', sheets)
+            self.assertEqual(1, len(list(Path(tmpdir).iterdir())))
+
+            # the second read comes from the cache
+            with patch('pandas.read_excel', side_effect=AssertionError('not cached')):
+                cached = uut.read_frames('example/bedrock.xlsx', sheets)
+                self.assertTrue(frames['Actions'].equals(cached['Actions']))
+
+                # different options do NOT use the cached values
+                self.assertRaises(AssertionError, lambda: uut.read_frames('example/bedrock.xlsx', ['Users']))
+
+            # a broken cache is replaced
+            cache = next(Path(tmpdir).iterdir())
+            cache.write_bytes(b'garbage')
+            cached = uut.read_frames('example/bedrock.xlsx', sheets)
+            self.assertTrue(frames['Users'].equals(cached['Users']))
+            self.assertNotEqual(b'garbage', cache.read_bytes())
+
+            # so is a cache holding something else
+            cache.write_bytes(pickle.dumps(42))
+            cached = uut.read_frames('example/bedrock.xlsx', sheets)
+            self.assertTrue(frames['Users'].equals(cached['Users']))
+
+            # and one that cannot be loaded (e.g. written by another pandas version)
+            with patch('pickle.load', side_effect=AttributeError('no such class')):
+                cached = uut.read_frames('example/bedrock.xlsx', sheets)
+            self.assertTrue(frames['Users'].equals(cached['Users']))
+
+            # a different Excel engine does NOT use the cached values
+            with patch('reminders.EXCEL_ENGINE', 'other'):
+                with patch('pandas.read_excel', side_effect=AssertionError('not cached')):
+                    self.assertRaises(AssertionError, lambda: uut.read_frames('example/bedrock.xlsx', sheets))
+
+            # missing files are still an error
+            self.assertRaises(FileNotFoundError, lambda: uut.read_frames('foo', sheets))
 
     def test_reminders_find_user(self):
         uut = Reminders()
@@ -87,6 +235,48 @@ class TestReminders(unittest.TestCase):
 
         self.assertRaises(AmbiguousUser, lambda: uut.find_user(users, 'slate'))
         self.assertRaises(AmbiguousUser, lambda: uut.find_user(users, 'flintstone'))
+        self.assertRaisesRegex(AmbiguousUser, 'Users:1, Users:3', lambda: uut.find_user(users, 'slate'))
+
+    def test_reminders_find_user_exact(self):
+        uut = Reminders()
+        uut.hdr_email = 'Email'
+        fred = {'User': 'Fred', 'Email': 'flint@bedrock.com', 'Aliases': 'FF/Freddie', ROW_HEADER: 'Users:1'}
+        freddy = {'User': 'Freddy', 'Email': 'freddy@bedrock.com', 'Aliases': 'FK, Krueger', ROW_HEADER: 'Users:2'}
+        users = [fred, freddy]
+
+        # an exact value, token, or email name wins over a partial match
+        self.assertEqual(fred, uut.find_user(users, 'fred'))
+        self.assertEqual(fred, uut.find_user(users, ' freddie '))
+        self.assertEqual(fred, uut.find_user(users, 'Flint'))
+        self.assertEqual(freddy, uut.find_user(users, 'krueger'))
+
+        # partial matches still work
+        self.assertEqual(freddy, uut.find_user(users, 'eddy'))
+        self.assertRaises(AmbiguousUser, lambda: uut.find_user(users, 'red'))
+
+        # aliases can also be separated by whitespace
+        freddy['Aliases'] = 'FK Krueger'
+        self.assertEqual(freddy, uut.find_user(users, 'fk'))
+
+        # an exact match on several users is ambiguous
+        freddy['Aliases'] = 'FF'
+        self.assertRaises(AmbiguousUser, lambda: uut.find_user(users, 'ff'))
+
+        # values that are not strings (e.g. from a list not read by read_frames) are skipped
+        dino = {'User': 'Dino', 'Email': None, 'Phone': 123, ROW_HEADER: 'Users:4'}
+        self.assertEqual(fred, uut.find_user([fred, dino], 'flint'))
+        self.assertEqual(dino, uut.find_user([fred, dino], 'dino'))
+        self.assertEqual(None, uut.find_user([fred, dino], '123'))
+
+        # nothing is found without any users, even for a blank name
+        self.assertEqual(None, uut.find_user([], ''))
+        self.assertEqual(None, uut.find_user([], ' '))
+        uut.hdr_user = 'User'
+        self.assertRaises(MissingUser, lambda: uut.correlate([], [{'User': ' ', ROW_HEADER: 'Actions:1'}]))
+
+        # matching is caseless, not just lowercased
+        gross = {'User': 'Hans Groß', 'Email': 'hans@bedrock.com', 'Aliases': '', ROW_HEADER: 'Users:3'}
+        self.assertEqual(gross, uut.find_user([fred, gross], 'GROSS'))
 
     def test_reminders_config_example(self):
         uut = Reminders()
@@ -106,6 +296,8 @@ class TestReminders(unittest.TestCase):
         self.assertEqual('slate@slaterockandgravel.com', uut.mail_from)
         self.assertEqual('Do It! Now!!!', uut.mail_subject)
         self.assertEqual(None, uut.mail_cc)
+        self.assertEqual(1, uut.mail_connections)
+        self.assertEqual(100, uut.mail_max_per_connection)
 
         self.assertIn('The following actions assigned to you', uut.msg_preamble)
         self.assertEqual('<p/><p>Thank you,</p><p>Mr. Slate<br/>Slate Rock and Gravel</p>', uut.msg_close)
@@ -154,6 +346,35 @@ class TestReminders(unittest.TestCase):
         uut.update_config(config)
         self.assertEqual([mail1, mail2], uut.mail_cc)
 
+    def test_reminders_config_connections(self):
+        uut = Reminders()
+
+        # start with a baseline config
+        config = SafeConfigParser()
+        config.read('example/config.ini')
+
+        config.set(CSECT_EMAIL, 'connections', '3')
+        config.set(CSECT_EMAIL, 'messages_per_connection', '25')
+        uut.update_config(config)
+        self.assertEqual(3, uut.mail_connections)
+        self.assertEqual(25, uut.mail_max_per_connection)
+
+        config.set(CSECT_EMAIL, 'connections', 'many')
+        self.assertRaises(ValueError, lambda: uut.update_config(config))
+
+        # a pool needs at least one server, that sends at least one message
+        for option, value in [('connections', '0'), ('connections', '-2'), ('messages_per_connection', '0')]:
+            config = SafeConfigParser()
+            config.read('example/config.ini')
+            config.set(CSECT_EMAIL, option, value)
+            self.assertRaises(ValueError, lambda: uut.update_config(config))
+
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        self.assertEqual([], uut.check_config())
+        uut.mail_connections = 0
+        self.assertEqual(['Mail connections and messages per connection must be at least 1'], uut.check_config())
+
     def test_reminders_config_table_headers(self):
         uut = Reminders()
 
@@ -216,8 +437,8 @@ class TestReminders(unittest.TestCase):
     def test_reminders_correlate_example(self):
         uut = Reminders()
         uut.parse_config('example/config.ini')  # correlation needs the fields initialized
-        users = uut.sheet_to_dict('example/bedrock.xlsx', 'Users')
-        actions = uut.sheet_to_dict('example/bedrock.xlsx', 'Actions')
+        users = copy.deepcopy(self.example_users)
+        actions = copy.deepcopy(self.example_actions)
         correlated = uut.correlate(users, actions)
         self.assertEqual(len(users), len(correlated))
 
@@ -249,6 +470,28 @@ class TestReminders(unittest.TestCase):
         actions[2].update({'User': 'Bam Bam'})
         self.assertRaises(MissingUser, lambda: uut.correlate(users, actions))
 
+    def test_reminders_correlate_same_name(self):
+        uut = Reminders()
+        uut.hdr_user = 'User'
+        uut.hdr_email = 'Email'
+        senior = {'User': 'Fred', 'Email': 'fred@bedrock.com', 'Aliases': 'Sr', ROW_HEADER: 'Users:1'}
+        junior = {'User': 'Fred', 'Email': 'freddy@bedrock.com', 'Aliases': 'Jr', ROW_HEADER: 'Users:2'}
+        actions = [
+            {'User': 'jr', ROW_HEADER: 'Actions:1'},
+            {'User': 'sr/jr', ROW_HEADER: 'Actions:2'},
+        ]
+
+        # users that share a name are still kept apart, in the order first assigned
+        correlated = uut.correlate([senior, junior], actions)
+        self.assertEqual([junior, senior], [u for u, _ in correlated])
+        self.assertEqual(['Actions:1', 'Actions:2'], [_.get(ROW_HEADER) for _ in correlated[0][1]])
+        self.assertEqual(['Actions:2'], [_.get(ROW_HEADER) for _ in correlated[1][1]])
+
+        # the actions can also be looked up by user
+        self.assertIs(correlated[0][1], correlated.actions_for(junior))
+        self.assertEqual(['Actions:2'], [_.get(ROW_HEADER) for _ in correlated.actions_for(senior)])
+        self.assertEqual([], correlated.actions_for({'User': 'Fred'}))
+
     def read_text(self, filename: str) -> str:
         with open(filename) as fp:
             return fp.read()
@@ -256,7 +499,7 @@ class TestReminders(unittest.TestCase):
     def test_reminders_table(self):
         uut = Reminders()
         uut.parse_config('example/config.ini')  # table creation needs the fields initialized
-        actions = uut.sheet_to_dict('example/bedrock.xlsx', 'Actions')
+        actions = copy.deepcopy(self.example_actions)
 
         expected = self.read_text('resources/all_actions.html')
         self.assertEqual(expected, uut._create_table(actions, Format.HTML))
@@ -267,10 +510,44 @@ class TestReminders(unittest.TestCase):
         expected = self.read_text('resources/all_actions.csv').replace('\n', '\r\n')
         self.assertEqual(expected, uut._create_table(actions, Format.CSV))
 
+    def test_reminders_table_reuse(self):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')  # table creation needs the fields initialized
+        actions = copy.deepcopy(self.example_actions)
+
+        # rows from a previous table do NOT leak into the next one
+        self.assertEqual(2, len(uut._create_table(actions[:1], Format.CSV).splitlines()))
+        expected = self.read_text('resources/all_actions.txt')
+        self.assertEqual(expected, uut._create_table(actions, Format.TEXT))
+
+        # changing the headers gets a new table
+        uut.msg_table_headers = ['ID', 'Status']
+        self.assertEqual('ID,Status\r\nSG1,Open\r\n', uut._create_table(actions[:1], Format.CSV))
+
+    def test_reminders_substitute(self):
+        uut = Reminders()
+        user = {'First': 'Fred', 'First Name': 'Freddie'}
+        self.assertEqual('Hi Fred, due in 7 days', uut.substitute('Hi {First}, due in {days} days', user, 7))
+        self.assertEqual('<p>Freddie</p>', uut.substitute('<p>{First Name}</p>', user, 7))
+        self.assertEqual('No fields', uut.substitute('No fields', user, 7))
+        self.assertRaises(ValueError, lambda: uut.substitute('Hi {Last}', user, 7))
+
+        # any field that get_fields() finds gets substituted, and other braces are left alone
+        user = {'Start.Date': '2030-03-24', 'Items[0]': 'rocks', 'Due:Soon': 'yes'}
+        template = '<p>{Start.Date} {Items[0]} {Due:Soon}</p> } {'
+        self.assertEqual(set(user), uut.get_fields(template))
+        self.assertEqual('<p>2030-03-24 rocks yes</p> } {', uut.substitute(template, user, 7))
+
+    def test_reminders_get_fields(self):
+        uut = Reminders()
+        self.assertEqual(set(['First', 'days']), uut.get_fields('<p>Hi {First}, due in {days} days</p>'))
+        self.assertEqual(set(['First Name']), uut.get_fields('{First Name}\n{First Name}'))
+        self.assertEqual(set(), uut.get_fields('No fields {}'))
+
     def test_reminders_validate_users(self):
         uut = Reminders()
         uut.parse_config('example/config.ini')  # correlation needs the fields initialized
-        users = uut.sheet_to_dict('example/bedrock.xlsx', 'Users')
+        users = copy.deepcopy(self.example_users)
 
         self.assertEqual([], uut.validate_users(users))
 
@@ -292,10 +569,17 @@ class TestReminders(unittest.TestCase):
         self.assertIn('Barney Rubble (Users:3) error(s): missing email fields Bar/Foo', errors)
         self.assertIn('Betty Rubble (Users:4) error(s): missing email, missing email fields Bar/Foo', errors)
 
+        # in a list, a single user can be missing a field
+        users = copy.deepcopy(self.example_users)
+        users[1].pop('First')
+        uut.msg_preamble = '<p>Hi {First}</p>'
+        uut.msg_close = ''
+        self.assertEqual(['Wilma Flintstone (Users:2) error(s): missing email fields First'], uut.validate_users(users))
+
     def test_reminders_validate_actions(self):
         uut = Reminders()
         uut.parse_config('example/config.ini')  # correlation needs the fields initialized
-        actions = uut.sheet_to_dict('example/bedrock.xlsx', 'Actions')
+        actions = copy.deepcopy(self.example_actions)
 
         self.assertEqual([], uut.validate_actions(actions))
 
@@ -316,6 +600,133 @@ class TestReminders(unittest.TestCase):
         self.assertIn('FS1 (Actions:3) error(s): missing table fields Foo/Sna', errors)
         self.assertIn('Rubble1 (Actions:4) error(s): missing assignment, missing due date, missing table fields Foo/Sna', errors)  # noqa: E501
 
+        # in a list, a single action can be missing a field
+        actions = copy.deepcopy(self.example_actions)
+        actions[2].pop('Notes')
+        uut.msg_table_headers = ['ID', 'Notes']
+        self.assertEqual(['FS1 (Actions:3) error(s): missing table fields Notes'], uut.validate_actions(actions))
+
+    def test_reminders_render_messages(self):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        uut.mail_cc = ['dino@flintstones.com']
+        users = copy.deepcopy(self.example_users)
+        actions = copy.deepcopy(self.example_actions)
+        user_actions = uut.correlate(users, actions)
+
+        messages = uut._render_messages(user_actions, 14)
+        self.assertEqual(len(user_actions), len(messages))
+        for (user, _), (rendered, sender, to, message) in zip(user_actions, messages):
+            self.assertEqual(user, rendered)
+            self.assertEqual(uut.mail_from, sender)
+            self.assertEqual([user.get(uut.hdr_email), 'dino@flintstones.com'], to)
+            self.assertIn(f"Hi {user.get('First')},".encode(), message)
+            self.assertIn(b'through the next 14 days', message)
+            self.assertIn(b'CC: dino@flintstones.com', message)
+
+        # a missing template field is caught before anything is sent
+        uut.msg_close = '{Last}'
+        self.assertRaises(ValueError, lambda: uut._render_messages(user_actions, 14))
+
+    def test_reminders_validate_frames(self):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')  # validation needs the fields initialized
+        frames = uut.read_frames('example/bedrock.xlsx', ['Users', 'Actions'])
+        users = frames['Users']
+        actions = frames['Actions']
+
+        self.assertEqual([], uut.validate_users(users))
+        self.assertEqual([], uut.validate_actions(actions))
+
+        users.loc[1, uut.hdr_email] = ''
+        actions.loc[2, uut.hdr_due] = None
+        self.assertEqual(['Wilma Flintstone (Users:2) error(s): missing email'], uut.validate_users(users))
+        self.assertEqual(['FS1 (Actions:3) error(s): missing due date'], uut.validate_actions(actions))
+
+        # missing columns are reported for every row
+        errors = uut.validate_actions(actions.drop(columns=['Notes']))
+        self.assertEqual(4, len(errors))
+        self.assertIn('FS1 (Actions:3) error(s): missing due date, missing table fields Notes', errors)
+
+    @patch('reminders.Reminders.print')
+    def test_reminders_send_all_emails_parallel(self, mock_print):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        users = copy.deepcopy(self.example_users)
+        actions = copy.deepcopy(self.example_actions)
+        user_actions = uut.correlate(users, actions)
+
+        servers = []
+
+        def connect() -> Mock:
+            servers.append(Mock())
+            return servers[-1]
+
+        uut._pool = SMTPPool(connect, size=3)
+        uut.send_all_emails(user_actions, 14)
+        self.assertLessEqual(len(servers), 3)
+        sent = [c.args[1][0] for s in servers for c in s.sendmail.call_args_list]
+        self.assertEqual(sorted([u.get(uut.hdr_email) for (u, _) in user_actions]), sorted(sent))
+        uut.close_email_pool()
+
+    @patch('reminders.getpass', side_effect=lambda _: time.sleep(0.05) or 'secret')  # slow, like a person
+    @patch('reminders.Reminders.print')
+    @patch('smtplib.SMTP.quit')
+    @patch('smtplib.SMTP.sendmail', side_effect=lambda *_: time.sleep(0.05))  # keeps each server busy
+    @patch('smtplib.SMTP.login')
+    @patch('smtplib.SMTP.starttls')
+    @patch('smtplib.SMTP.connect', return_value=(220, b'ready'))
+    def test_reminders_send_all_emails_prompt_once(
+        self, mock_connect, mock_starttls, mock_login, mock_send, mock_quit, mock_print, mock_getpass
+    ):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        uut.mail_password = None
+        uut.mail_connections = 3
+        user_actions = uut.correlate(copy.deepcopy(self.example_users), copy.deepcopy(self.example_actions))
+
+        # the servers get connected by several threads, but the password is only asked for once
+        uut.send_all_emails(user_actions, 14)
+        mock_getpass.assert_called_once()
+        self.assertLess(1, mock_login.call_count)
+        self.assertEqual({('secret',)}, {c.args[1:] for c in mock_login.call_args_list})
+        self.assertEqual(len(user_actions), mock_send.call_count)
+        uut.close_email_pool()
+
+    @patch('smtplib.SMTP.quit')
+    @patch('smtplib.SMTP.noop')
+    @patch('smtplib.SMTP.login')
+    @patch('smtplib.SMTP.starttls')
+    @patch('smtplib.SMTP.connect', return_value=(220, b'ready'))
+    def test_reminders_email_pool_reuse(self, mock_connect, mock_starttls, mock_login, mock_noop, mock_quit):
+        uut = Reminders()
+        uut.parse_config('example/config.ini')
+        uut.mail_password = 'abc123'  # avoid prompting
+
+        # a healthy server is re-used
+        mock_noop.return_value = (250, b'ok')
+        pool = uut.get_email_pool()
+        with pool.acquire() as server:
+            pass
+        self.assertEqual(pool, uut.get_email_pool())
+        with pool.acquire() as again:
+            self.assertEqual(server, again)
+        self.assertEqual(1, mock_login.call_count)
+        self.assertEqual(1, mock_noop.call_count)
+
+        # a server that went away is replaced
+        mock_noop.return_value = (421, b'closing')
+        pool = uut.get_email_pool()
+        self.assertEqual(1, mock_quit.call_count)
+        with pool.acquire() as again:
+            self.assertNotEqual(server, again)
+        self.assertEqual(2, mock_login.call_count)
+
+        uut.close_email_pool()
+        self.assertEqual(2, mock_quit.call_count)
+        uut.close_email_pool()  # closing again is harmless
+        self.assertEqual(2, mock_quit.call_count)
+
     @patch('reminders.Reminders.print')
     @patch('smtplib.SMTP.sendmail')
     @patch('smtplib.SMTP.login')
@@ -346,8 +757,20 @@ class TestReminders(unittest.TestCase):
         ]
         self.assertEqual(print_calls, mock_print.call_args_list)
 
+    def test_reminders_lazy_imports(self):
+        # the heavy modules are not loaded just to parse the args/config
+        heavy = '{"pandas", "smtplib", "email.mime.text"}'
+        for args, result in [(None, None), ([], 5), (['-c', 'example/config.ini'], 1)]:
+            run = '' if args is None else f'assert reminders.Reminders().run({args}) == {result}; '
+            code = f'import sys, reminders; {run}print(sorted(set(sys.modules) & {heavy}))'
+            output = subprocess.run(
+                [sys.executable, '-c', code], cwd=Path(__file__).parent, capture_output=True, text=True, check=True
+            )
+            self.assertEqual('[]', output.stdout.splitlines()[-1], args)
+
+    @patch('reminders.Reminders.read_frames')
     @patch('reminders.Reminders.print')
-    def test_reminders_run_no_config(self, mock_print):
+    def test_reminders_run_no_config(self, mock_print, mock_read):
         uut = Reminders()
         uut.mail_password = 'abc123'  # avoid prompting
 
@@ -357,10 +780,12 @@ class TestReminders(unittest.TestCase):
         ]
         result = uut.run(args)
         self.assertEqual(5, result)
+        mock_read.assert_not_called()  # the spreadsheet is never loaded
         mock_print.assert_called_once_with('Configuration errors:\n\tMissing spreadsheet tab name for actions\n\tMissing spreadsheet tab name for users\n\tMissing user/action user-id field\n\tMissing user email field\n\tMissing action identifier field\n\tMissing action due date field\n\tMissing action status field\n\tMissing mail server or port\n\tMissing mail from address\n\tMissing mail subject\n\tMissing message table headers')  # noqa: E501
 
+    @patch('reminders.Reminders.read_frames')
     @patch('reminders.Reminders.print')
-    def test_reminders_run_no_spreadsheet(self, mock_print):
+    def test_reminders_run_no_spreadsheet(self, mock_print, mock_read):
         uut = Reminders()
         uut.mail_password = 'abc123'  # avoid prompting
 
@@ -370,6 +795,7 @@ class TestReminders(unittest.TestCase):
         ]
         result = uut.run(args)
         self.assertEqual(1, result)
+        mock_read.assert_not_called()
         mock_print.assert_called_once_with('bedrock.xlsx is not a file!')
 
     def test_reminders_run_print(self):
@@ -465,6 +891,17 @@ class TestReminders(unittest.TestCase):
         message = mock_print.call_args.args[0]
         self.assertTrue(message.startswith('Invalid users:'))
 
+    @patch('reminders.Reminders.print')
+    def test_reminders_run_no_status(self, mock_print):
+        uut = Reminders()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # without the status column, there are no open actions
+            config = Path(tmpdir) / 'config.ini'
+            config.write_text(self.read_text('example/config.ini').replace('= Status', '= No Such Status'))
+            result = uut.run(['-c', str(config), '-s', 'example/bedrock.xlsx'])
+        self.assertEqual(0, result)
+        mock_print.assert_called_once_with('No open user actions found in example/bedrock.xlsx in the next 14 days')
+
     @patch('reminders.Reminders.print')
     def test_reminders_run_missing_bad_actions(self, mock_print):
         uut = Reminders()
@@ -0,0 +1,81 @@
+import unittest
+
+from smtplib import SMTPServerDisconnected
+from unittest.mock import Mock
+
+from reminders import SMTPPool
+
+
+class TestSMTPPool(unittest.TestCase):
+    def new_server(self) -> Mock:
+        server = Mock()
+        server.noop.return_value = (250, b'ok')
+        self.servers.append(server)
+        return server
+
+    def setUp(self):
+        self.servers = []
+
+    def test_smtp_pool_reuse(self):
+        uut = SMTPPool(self.new_server, size=2, max_per_conn=100)
+        for _ in range(5):
+            with uut.acquire() as server:
+                server.sendmail('from', ['to'], 'message')
+        self.assertEqual(1, len(self.servers))
+        self.assertEqual(5, self.servers[0].sendmail.call_count)
+
+    def test_smtp_pool_empty(self):
+        # without any servers (or messages), acquire() would block forever
+        self.assertRaises(ValueError, lambda: SMTPPool(self.new_server, size=0))
+        self.assertRaises(ValueError, lambda: SMTPPool(self.new_server, size=-1))
+        self.assertRaises(ValueError, lambda: SMTPPool(self.new_server, max_per_conn=0))
+
+    def test_smtp_pool_size(self):
+        uut = SMTPPool(self.new_server, size=2, max_per_conn=100)
+        with uut.acquire() as first:
+            with uut.acquire() as second:
+                self.assertNotEqual(first, second)
+        self.assertEqual(2, len(self.servers))
+
+    def test_smtp_pool_max_per_conn(self):
+        uut = SMTPPool(self.new_server, size=1, max_per_conn=2)
+        for _ in range(5):
+            with uut.acquire():
+                pass
+        self.assertEqual(3, len(self.servers))
+        self.assertEqual([1, 1, 0], [_.quit.call_count for _ in self.servers])
+
+    def test_smtp_pool_error(self):
+        uut = SMTPPool(self.new_server, size=1, max_per_conn=100)
+        with self.assertRaises(SMTPServerDisconnected):
+            with uut.acquire() as server:
+                raise SMTPServerDisconnected('gone')
+        server.quit.assert_called_once()
+
+        # a new server is used after the error
+        with uut.acquire() as again:
+            self.assertNotEqual(server, again)
+
+    def test_smtp_pool_check(self):
+        uut = SMTPPool(self.new_server, size=2, max_per_conn=100)
+        with uut.acquire() as first:
+            with uut.acquire() as second:
+                pass
+        first.noop.return_value = (421, b'closing')
+        second.noop.side_effect = SMTPServerDisconnected('gone')
+        second.quit.side_effect = SMTPServerDisconnected('gone')
+        uut.check()
+        first.quit.assert_called_once()
+        second.close.assert_called_once()
+
+        # only new servers are left
+        with uut.acquire() as server:
+            self.assertNotIn(server, (first, second))
+
+    def test_smtp_pool_close(self):
+        uut = SMTPPool(self.new_server, size=2, max_per_conn=100)
+        with uut.acquire():
+            with uut.acquire():
+                pass
+        uut.close()
+        self.assertEqual([1, 1], [_.quit.call_count for _ in self.servers])